@@ -14,31 +14,34 @@ APP = App(
     id=BASE_PROVIDER_IDENTIFIER,
     version=VERSION,
 )
+RECHECK_INTERVAL = 15
 
 
 omu = Omu(APP)
 chat = Chat(omu)
 
+service_classes: dict[Identifier, type[ProviderService]] = {
+    service_class.PROVIDER.id: service_class for service_class in retrieve_services()
+}
 services: dict[Identifier, ProviderService] = {}
 chat_services: dict[Identifier, ChatService] = {}
-
-for service_class in retrieve_services():
-    service = service_class(omu, chat)
-    services[service.provider.id] = service
+chat_tasks: dict[Identifier, asyncio.Task] = {}
 
 
 async def register_services():
-    for service in services.values():
-        await chat.providers.add(service.provider)
+    for service_class in service_classes.values():
+        await chat.providers.add(service_class.PROVIDER)
 
 
 async def update_channel(channel: Channel, service: ProviderService):
     try:
         if not channel.active:
-            for key, chat_service in tuple(chat_services.items()):
-                if chat_service.room.channel_id == channel.id:
-                    await chat_service.stop()
-                    del chat_services[key]
+            keys = [
+                key
+                for key, chat_service in chat_services.items()
+                if chat_service.room.channel_id == channel.id
+            ]
+            await stop_chat_services(keys)
             return
         fetched_rooms = await service.fetch_rooms(channel)
         for item in fetched_rooms:
@@ -46,12 +49,28 @@ async def update_channel(channel: Channel, service: ProviderService):
                 continue
             chat = await item.create()
             chat_services[item.room.id] = chat
-            asyncio.create_task(chat.start())
+            start_chat(item.room.id, chat)
             logger.info(f"Started chat for {item.room.key()}")
     except ProviderError as e:
         logger.error(f"Failed to update channel {channel.id}: {e}")
 
 
+def start_chat(room_id: Identifier, chat_service: ChatService):
+    task = asyncio.create_task(chat_service.start(), name=f"chat-{room_id.key()}")
+    chat_tasks[room_id] = task
+
+    def on_done(task: asyncio.Task):
+        if chat_tasks.get(room_id) is task:
+            del chat_tasks[room_id]
+        if task.cancelled() or task.exception() is None:
+            return
+        logger.opt(exception=task.exception()).error(f"Chat for {room_id} failed")
+        if chat_services.get(room_id) is chat_service:
+            del chat_services[room_id]
+
+    task.add_done_callback(on_done)
+
+
 @chat.on(events.channel.add)
 async def on_channel_create(channel: Channel):
     provider = get_provider(channel)
@@ -74,43 +93,65 @@ async def on_channel_update(channel: Channel):
 
 
 def get_provider(channel: Channel | Room) -> ProviderService | None:
-    if channel.provider_id not in services:
-        return None
-    return services[channel.provider_id]
-
-
-async def delay():
-    await asyncio.sleep(15 - time.time() % 15)
+    service = services.get(channel.provider_id)
+    if service is None:
+        service_class = service_classes.get(channel.provider_id)
+        if service_class is None:
+            return None
+        service = service_class(omu, chat)
+        services[channel.provider_id] = service
+    return service
 
 
 async def recheck_task():
+    next_tick = time.monotonic()
     while True:
-        await recheck_channels()
-        await recheck_rooms()
-        await delay()
+        await asyncio.gather(recheck_channels(), recheck_rooms())
+        next_tick += RECHECK_INTERVAL
+        now = time.monotonic()
+        if next_tick < now:
+            logger.warning(f"Recheck overran by {now - next_tick:.1f}s")
+            next_tick = now + RECHECK_INTERVAL
+        await asyncio.sleep(next_tick - now)
 
 
 async def recheck_rooms():
-    for service in tuple(chat_services.values()):
-        if service.closed:
-            del chat_services[service.room.id]
+    closed = [key for key, service in chat_services.items() if service.closed]
+    for key in closed:
+        del chat_services[key]
     rooms = await chat.rooms.fetch_items()
-    for room in filter(lambda r: r.connected, rooms.values()):
-        if room.provider_id not in services:
-            continue
-        if not await should_remove(room, services[room.provider_id]):
-            continue
-        await stop_room(room)
+    candidates = [
+        (room, provider)
+        for room in rooms.values()
+        if room.connected and (provider := get_provider(room)) is not None
+    ]
+    results = await asyncio.gather(
+        *(should_remove(room, provider) for room, provider in candidates)
+    )
+    await asyncio.gather(
+        *(
+            stop_room(room)
+            for (room, _), remove in zip(candidates, results, strict=True)
+            if remove
+        )
+    )
 
 
 async def stop_room(room: Room):
     room.status = "offline"
     room.connected = False
     await chat.rooms.update(room)
-    for key, service in tuple(chat_services.items()):
-        if service.room.key() == room.key():
-            await service.stop()
-            del chat_services[key]
+    room_key = room.key()
+    keys = [
+        key for key, service in chat_services.items() if service.room.key() == room_key
+    ]
+    await stop_chat_services(keys)
+
+
+async def stop_chat_services(keys: list[Identifier]):
+    await asyncio.gather(*(chat_services[key].stop() for key in keys))
+    for key in keys:
+        chat_services.pop(key, None)
 
 
 async def should_remove(room: Room, provider_service: ProviderService):
@@ -124,11 +165,18 @@ async def should_remove(room: Room, provider_service: ProviderService):
 
 async def recheck_channels():
     all_channels = await chat.channels.fetch_items()
-    for channel in all_channels.values():
-        provider = get_provider(channel)
-        if provider is None:
-            continue
-        await update_channel(channel, provider)
+    channels = [
+        (channel, provider)
+        for channel in all_channels.values()
+        if (provider := get_provider(channel)) is not None
+    ]
+    results = await asyncio.gather(
+        *(update_channel(channel, provider) for channel, provider in channels),
+        return_exceptions=True,
+    )
+    for (channel, _), result in zip(channels, results, strict=True):
+        if isinstance(result, Exception):
+            logger.opt(exception=result).error(f"Failed to update channel {channel.id}")
 
 
 @chat.on(events.message.add)
@@ -144,3 +192,13 @@ async def on_ready():
     await recheck_channels()
     asyncio.create_task(recheck_task())
     logger.info("Chat provider is ready")
+
+
+@omu.event.stopped.listen
+async def on_stopped():
+    tasks = tuple(chat_tasks.values())
+    chat_tasks.clear()
+    for task in tasks:
+        if task.get_loop().is_closed():
+            continue
+        task.cancel()
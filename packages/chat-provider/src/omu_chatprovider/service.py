@@ -3,6 +3,7 @@ from __future__ import annotations
 import abc
 from dataclasses import dataclass
 from importlib import metadata
+from typing import ClassVar
 
 from omu import Omu
 from omu.helper import Coro
@@ -18,12 +19,14 @@ class FetchedRoom:
 
 
 class ProviderService(abc.ABC):
+    PROVIDER: ClassVar[Provider]
+
     @abc.abstractmethod
     def __init__(self, omu: Omu, chat: Chat): ...
 
     @property
-    @abc.abstractmethod
-    def provider(self) -> Provider: ...
+    def provider(self) -> Provider:
+        return self.PROVIDER
 
     @abc.abstractmethod
     async def fetch_rooms(self, channel: Channel) -> list[FetchedRoom]: ...
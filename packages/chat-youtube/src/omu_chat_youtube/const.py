@@ -1,3 +1,5 @@
+import re
+
 from omu_chat.model import Provider
 from omu_chatprovider.chatprovider import BASE_PROVIDER_IDENTIFIER
 from omu_chatprovider.helper import HTTP_REGEX
@@ -10,6 +12,7 @@ YOUTUBE_REGEX = (
     r"|channel\/(?P<channel_id>[\w_-]+|)|user\/(?P<channel_id_user>[\w_-]+|)"
     r"|c\/(?P<channel_id_c>[\w_-]+|))"
 )
+YOUTUBE_PATTERN = re.compile(YOUTUBE_REGEX)
 PROVIDER = Provider(
     id=YOUTUBE_IDENTIFIER,
     url="youtube.com",
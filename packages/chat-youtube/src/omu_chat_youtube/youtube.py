@@ -1,6 +1,6 @@
 from omu import Omu
 from omu_chat import Chat
-from omu_chat.model import Channel, Provider, Room
+from omu_chat.model import Channel, Room
 from omu_chatprovider.helper import get_session
 from omu_chatprovider.service import FetchedRoom, ProviderService
 
@@ -13,16 +13,14 @@ from .youtubeapi import YoutubeAPI
 
 
 class YoutubeChatService(ProviderService):
+    PROVIDER = PROVIDER
+
     def __init__(self, omu: Omu, chat: Chat):
         self.omu = omu
         self.chat = chat
         self.session = get_session(PROVIDER)
         self.extractor = YoutubeAPI(omu, self.session)
 
-    @property
-    def provider(self) -> Provider:
-        return PROVIDER
-
     async def fetch_rooms(self, channel: Channel) -> list[FetchedRoom]:
         videos = await self.extractor.fetch_online_videos(channel.url)
         rooms: list[FetchedRoom] = []
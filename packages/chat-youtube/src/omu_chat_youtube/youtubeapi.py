@@ -16,7 +16,7 @@ from . import types
 from .const import (
     BASE_HEADERS,
     BASE_PAYLOAD,
-    YOUTUBE_REGEX,
+    YOUTUBE_PATTERN,
     YOUTUBE_URL,
 )
 
@@ -94,7 +94,7 @@ class YoutubeAPI:
 
     async def fetch_online_videos(self, url: str) -> list[str]:
         match = assert_none(
-            re.search(YOUTUBE_REGEX, url),
+            YOUTUBE_PATTERN.search(url),
             "Could not match url",
         )
         options = match.groupdict()
@@ -144,7 +144,7 @@ class YoutubeAPI:
         href = canonical_link.attrs.get("href")
         if href is None:
             return None
-        match = re.search(YOUTUBE_REGEX, href)
+        match = YOUTUBE_PATTERN.search(href)
         if match is None:
             return None
         options = match.groupdict()
@@ -163,7 +163,7 @@ class YoutubeAPI:
         href = link.attrs.get("href")
         if href is None:
             return None
-        match = re.search(YOUTUBE_REGEX, href)
+        match = YOUTUBE_PATTERN.search(href)
         if match is None:
             return None
         options = match.groupdict()
@@ -87,5 +87,4 @@ class Room(Keyable, Model[RoomJson], Hashable):
             return NotImplemented
         return self.key() == other.key()
 
-    def __hash__(self) -> int:
-        return hash(self.key())
+    __hash__ = Keyable.__hash__
@@ -64,8 +64,5 @@ class App(Keyable, Model[AppJson]):
     def key(self) -> str:
         return self.id.key()
 
-    def __hash__(self) -> int:
-        return hash(self.key())
-
     def __repr__(self) -> str:
         return f"App({self.key()})"
@@ -17,11 +17,13 @@ class EventEmitter[**P]:
         on_subscribe: Callable[[], None] | Coro[[], None] | None = None,
         on_empty: Callable[[], None] | Coro[[], None] | None = None,
         catch_errors: bool = False,
+        concurrent: bool = False,
     ) -> None:
         self.on_subscribe = on_subscribe
         self.on_empty = on_empty
         self.catch_errors = catch_errors
-        self._listeners: list[Callable[P, None] | Coro[P, None]] = []
+        self.concurrent = concurrent
+        self._listeners: tuple[Callable[P, None] | Coro[P, None], ...] = ()
         self.closed = False
 
     @property
@@ -30,7 +32,7 @@ class EventEmitter[**P]:
 
     def close(self) -> None:
         self.closed = True
-        self._listeners.clear()
+        self._listeners = ()
 
     def listen(self, listener: Callable[P, None] | Coro[P, None]) -> Unlisten:
         if self.closed:
@@ -41,13 +43,14 @@ class EventEmitter[**P]:
             coroutine = self.on_subscribe()
             if asyncio.iscoroutine(coroutine):
                 asyncio.create_task(coroutine)
-        self._listeners.append(listener)
+        self._listeners = (*self._listeners, listener)
         return lambda: self.unlisten(listener)
 
     def unlisten(self, listener: Callable[P, None] | Coro[P, None]) -> None:
         if listener not in self._listeners:
             return
-        self._listeners.remove(listener)
+        index = self._listeners.index(listener)
+        self._listeners = self._listeners[:index] + self._listeners[index + 1 :]
         if self.on_empty and len(self._listeners) == 0:
             coroutine = self.on_empty()
             if asyncio.iscoroutine(coroutine):
@@ -56,7 +59,10 @@ class EventEmitter[**P]:
     async def emit(self, *args: P.args, **kwargs: P.kwargs) -> None:
         if self.closed:
             raise ValueError("EventEmitter is closed")
-        for listener in tuple(self._listeners):
+        if self.concurrent:
+            await self._emit_concurrent(*args, **kwargs)
+            return
+        for listener in self._listeners:
             try:
                 if asyncio.iscoroutinefunction(listener):
                     await listener(*args, **kwargs)
@@ -68,6 +74,25 @@ class EventEmitter[**P]:
                 else:
                     raise e
 
+    async def _emit_concurrent(self, *args: P.args, **kwargs: P.kwargs) -> None:
+        async def call(listener: Callable[P, None] | Coro[P, None]) -> None:
+            if asyncio.iscoroutinefunction(listener):
+                await listener(*args, **kwargs)
+            else:
+                listener(*args, **kwargs)
+
+        results = await asyncio.gather(
+            *(call(listener) for listener in self._listeners),
+            return_exceptions=True,
+        )
+        for result in results:
+            if not isinstance(result, BaseException):
+                continue
+            if self.catch_errors and isinstance(result, Exception):
+                logger.opt(exception=result).error("Error in listener")
+            else:
+                raise result
+
     def __iadd__(self, listener: Callable[P, None] | Coro[P, None]) -> Self:
         self.listen(listener)
         return self
@@ -45,6 +45,9 @@ class Table[T](abc.ABC):
     @abc.abstractmethod
     async def clear(self) -> None: ...
 
+    @abc.abstractmethod
+    async def flush(self) -> None: ...
+
     @abc.abstractmethod
     async def fetch_items(
         self,
@@ -100,13 +103,22 @@ class TableEvents[T]:
                 self.unlisten()
 
         self.add: EventEmitter[Mapping[str, T]] = EventEmitter(
-            on_subscribe=listen, on_empty=unlisten
+            on_subscribe=listen,
+            on_empty=unlisten,
+            catch_errors=True,
+            concurrent=True,
         )
         self.update: EventEmitter[Mapping[str, T]] = EventEmitter(
-            on_subscribe=listen, on_empty=unlisten
+            on_subscribe=listen,
+            on_empty=unlisten,
+            catch_errors=True,
+            concurrent=True,
         )
         self.remove: EventEmitter[Mapping[str, T]] = EventEmitter(
-            on_subscribe=listen, on_empty=unlisten
+            on_subscribe=listen,
+            on_empty=unlisten,
+            catch_errors=True,
+            concurrent=True,
         )
         self.clear: EventEmitter[[]] = EventEmitter(
             on_subscribe=listen, on_empty=unlisten
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from collections.abc import AsyncGenerator, Iterable, Mapping
+from types import MappingProxyType
+
+from loguru import logger
 
 from omu.client import Client
 from omu.event_emitter import Unlisten
@@ -10,7 +15,12 @@ from omu.helper import AsyncCallback, Coro
 from omu.identifier import Identifier
 from omu.interface import Keyable
 from omu.network.packet.packet import PacketType
-from omu.serializer import JsonSerializable, Serializer
+from omu.serializer import (
+    JsonSerializable,
+    Serializer,
+    batch_deserialize,
+    batch_serialize,
+)
 
 from .packets import (
     SetConfigPacket,
@@ -36,7 +46,7 @@ type ModelType[T: Keyable, D] = JsonSerializable[T, D]
 class TableExtension(Extension):
     def __init__(self, client: Client):
         self._client = client
-        self._tables: dict[Identifier, Table] = {}
+        self._tables: dict[Identifier, TableImpl] = {}
         client.network.register_packet(
             TABLE_SET_PERMISSION_PACKET,
             TABLE_SET_CONFIG_PACKET,
@@ -48,6 +58,45 @@ class TableExtension(Extension):
             TABLE_ITEM_REMOVE_PACKET,
             TABLE_ITEM_CLEAR_PACKET,
         )
+        client.network.add_packet_handler(TABLE_PROXY_PACKET, self._on_proxy)
+        client.network.add_packet_handler(TABLE_ITEM_ADD_PACKET, self._on_item_add)
+        client.network.add_packet_handler(
+            TABLE_ITEM_UPDATE_PACKET, self._on_item_update
+        )
+        client.network.add_packet_handler(
+            TABLE_ITEM_REMOVE_PACKET, self._on_item_remove
+        )
+        client.network.add_packet_handler(TABLE_ITEM_CLEAR_PACKET, self._on_item_clear)
+
+    async def _on_proxy(self, packet: TableProxyPacket) -> None:
+        table = self._tables.get(packet.id)
+        if table is None:
+            return
+        await table._on_proxy(packet)
+
+    async def _on_item_add(self, packet: TableItemsPacket) -> None:
+        table = self._tables.get(packet.id)
+        if table is None:
+            return
+        await table._on_item_add(packet)
+
+    async def _on_item_update(self, packet: TableItemsPacket) -> None:
+        table = self._tables.get(packet.id)
+        if table is None:
+            return
+        await table._on_item_update(packet)
+
+    async def _on_item_remove(self, packet: TableItemsPacket) -> None:
+        table = self._tables.get(packet.id)
+        if table is None:
+            return
+        await table._on_item_remove(packet)
+
+    async def _on_item_clear(self, packet: TablePacket) -> None:
+        table = self._tables.get(packet.id)
+        if table is None:
+            return
+        await table._on_item_clear(packet)
 
     def create[T](
         self,
@@ -187,7 +236,8 @@ class TableImpl[T](Table[T]):
         self._id = table_type.id
         self._serializer = table_type.serializer
         self._key_function = table_type.key_function
-        self._cache: dict[str, T] = {}
+        self._table_packet = TablePacket(id=self._id)
+        self._cache: OrderedDict[str, T] = OrderedDict()
         self._event = TableEvents[T](self)
         self._proxies: list[Coro[[T], T | None]] = []
         self._chunk_size = 100
@@ -195,32 +245,16 @@ class TableImpl[T](Table[T]):
         self._listening = False
         self._config: TableConfig | None = None
         self._permissions: TablePermissions | None = table_type.permissions
+        self._pending: list[tuple[PacketType[TableItemsPacket], dict[str, bytes]]] = []
+        self._doorbell = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
 
-        client.network.add_packet_handler(
-            TABLE_PROXY_PACKET,
-            self._on_proxy,
-        )
-        client.network.add_packet_handler(
-            TABLE_ITEM_ADD_PACKET,
-            self._on_item_add,
-        )
-        client.network.add_packet_handler(
-            TABLE_ITEM_UPDATE_PACKET,
-            self._on_item_update,
-        )
-        client.network.add_packet_handler(
-            TABLE_ITEM_REMOVE_PACKET,
-            self._on_item_remove,
-        )
-        client.network.add_packet_handler(
-            TABLE_ITEM_CLEAR_PACKET,
-            self._on_item_clear,
-        )
         client.network.add_task(self._on_ready)
 
     @property
     def cache(self) -> Mapping[str, T]:
-        return self._cache
+        return MappingProxyType(self._cache)
 
     async def get(self, key: str) -> T | None:
         if key in self._cache:
@@ -229,7 +263,7 @@ class TableImpl[T](Table[T]):
             TABLE_ITEM_GET_ENDPOINT, TableKeysPacket(id=self._id, keys=[key])
         )
         items = self._parse_items(res.items)
-        self._cache.update(items)
+        await self.update_cache(items)
         if key in items:
             return items[key]
         return None
@@ -239,29 +273,77 @@ class TableImpl[T](Table[T]):
             TABLE_ITEM_GET_ENDPOINT, TableKeysPacket(id=self._id, keys=keys)
         )
         items = self._parse_items(res.items)
-        self._cache.update(items)
+        await self.update_cache(items)
         return items
 
     async def add(self, *items: T) -> None:
-        data = self._serialize_items(items)
-        await self._client.send(
-            TABLE_ITEM_ADD_PACKET, TableItemsPacket(id=self._id, items=data)
-        )
+        await self._enqueue(TABLE_ITEM_ADD_PACKET, items)
 
     async def update(self, *items: T) -> None:
-        data = self._serialize_items(items)
-        await self._client.send(
-            TABLE_ITEM_UPDATE_PACKET, TableItemsPacket(id=self._id, items=data)
-        )
+        await self._enqueue(TABLE_ITEM_UPDATE_PACKET, items)
 
     async def remove(self, *items: T) -> None:
-        data = self._serialize_items(items)
-        await self._client.send(
-            TABLE_ITEM_REMOVE_PACKET, TableItemsPacket(id=self._id, items=data)
-        )
+        await self._enqueue(TABLE_ITEM_REMOVE_PACKET, items)
 
     async def clear(self) -> None:
-        await self._client.send(TABLE_ITEM_CLEAR_PACKET, TablePacket(id=self._id))
+        await self.flush()
+        await self._client.send(TABLE_ITEM_CLEAR_PACKET, self._table_packet)
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            pending, self._pending = self._pending, []
+            for index, (packet_type, items) in enumerate(pending):
+                chunks = tuple(self._chunk_items(items))
+                for chunk_index, chunk in enumerate(chunks):
+                    try:
+                        await self._client.send(
+                            packet_type, TableItemsPacket(id=self._id, items=chunk)
+                        )
+                    except Exception:
+                        unsent: dict[str, bytes] = {}
+                        for rest in chunks[chunk_index:]:
+                            unsent.update(rest)
+                        self._pending[:0] = [
+                            (packet_type, unsent),
+                            *pending[index + 1 :],
+                        ]
+                        raise
+
+    def _chunk_items(self, items: dict[str, bytes]) -> Iterable[dict[str, bytes]]:
+        if len(items) <= self._chunk_size:
+            return (items,)
+        entries = tuple(items.items())
+        return (
+            dict(entries[i : i + self._chunk_size])
+            for i in range(0, len(entries), self._chunk_size)
+        )
+
+    async def _enqueue(
+        self, packet_type: PacketType[TableItemsPacket], items: tuple[T, ...]
+    ) -> None:
+        if self._flush_task is None:
+            self._flush_task = self._client.loop.create_task(self._flush_loop())
+        for i in range(0, len(items), self._chunk_size):
+            if i > 0:
+                await asyncio.sleep(0)
+            data = self._serialize_items(items[i : i + self._chunk_size])
+            if self._pending and self._pending[-1][0] is packet_type:
+                self._pending[-1][1].update(data)
+            else:
+                self._pending.append((packet_type, data))
+            self._doorbell.set()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await self._doorbell.wait()
+            self._doorbell.clear()
+            await asyncio.sleep(0)
+            if not self._client.network.connected:
+                continue
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.opt(exception=e).error(f"Failed to flush table {self._id}")
 
     async def fetch_items(
         self,
@@ -288,7 +370,7 @@ class TableImpl[T](Table[T]):
 
     async def fetch_all(self) -> dict[str, T]:
         items_response = await self._client.endpoints.call(
-            TABLE_FETCH_ALL_ENDPOINT, TablePacket(id=self._id)
+            TABLE_FETCH_ALL_ENDPOINT, self._table_packet
         )
         items = self._parse_items(items_response.items)
         await self.update_cache(items)
@@ -307,6 +389,7 @@ class TableImpl[T](Table[T]):
         for item in items.values():
             yield item
         while len(items) > 0:
+            await asyncio.sleep(0)
             cursor = next(iter(items.keys()))
             items = await self.fetch_items(
                 before=self._chunk_size if backward else None,
@@ -318,9 +401,7 @@ class TableImpl[T](Table[T]):
             items.pop(cursor, None)
 
     async def size(self) -> int:
-        res = await self._client.endpoints.call(
-            TABLE_SIZE_ENDPOINT, TablePacket(id=self._id)
-        )
+        res = await self._client.endpoints.call(TABLE_SIZE_ENDPOINT, self._table_packet)
         return res
 
     def listen(
@@ -352,8 +433,12 @@ class TableImpl[T](Table[T]):
         if self._client.running:
             raise ValueError("Cannot set config after client has started")
         self._config = config
+        if "cache_size" in config:
+            self._cache_size = config["cache_size"]
 
     async def _on_ready(self) -> None:
+        if self._pending:
+            self._doorbell.set()
         if self._config is not None:
             await self._client.send(
                 TABLE_SET_CONFIG_PACKET,
@@ -376,16 +461,14 @@ class TableImpl[T](Table[T]):
         )
 
     async def _on_proxy(self, packet: TableProxyPacket) -> None:
-        if packet.id != self._id:
-            return
         items = self._parse_items(packet.items)
         for proxy in self._proxies:
-            for key, item in list(items.items()):
+            proxied_items: dict[str, T] = {}
+            for key, item in items.items():
                 updated_item = await proxy(item)
-                if updated_item is None:
-                    del items[key]
-                else:
-                    items[key] = updated_item
+                if updated_item is not None:
+                    proxied_items[key] = updated_item
+            items = proxied_items
         serialized_items = self._serialize_items(items.values())
         await self._client.send(
             TABLE_PROXY_PACKET,
@@ -397,24 +480,18 @@ class TableImpl[T](Table[T]):
         )
 
     async def _on_item_add(self, packet: TableItemsPacket) -> None:
-        if packet.id != self._id:
-            return
         items = self._parse_items(packet.items)
-        await self._event.add(items)
-        await self.update_cache(items)
+        await asyncio.gather(self._event.add(items), self.update_cache(items))
 
     async def _on_item_update(self, packet: TableItemsPacket) -> None:
-        if packet.id != self._id:
-            return
         items = self._parse_items(packet.items)
-        await self._event.update(items)
-        await self.update_cache(items)
+        await asyncio.gather(self._event.update(items), self.update_cache(items))
 
     async def _on_item_remove(self, packet: TableItemsPacket) -> None:
-        if packet.id != self._id:
-            return
         items = self._parse_items(packet.items)
-        await self._event.remove(items)
+        await asyncio.gather(self._event.remove(items), self.remove_cache(items))
+
+    async def remove_cache(self, items: Mapping[str, T]) -> None:
         for key in items.keys():
             if key not in self._cache:
                 continue
@@ -422,36 +499,38 @@ class TableImpl[T](Table[T]):
         await self._event.cache_update(self._cache)
 
     async def _on_item_clear(self, packet: TablePacket) -> None:
-        if packet.id != self._id:
-            return
         await self._event.clear()
         self._cache.clear()
         await self._event.cache_update(self._cache)
 
     async def update_cache(self, items: Mapping[str, T]) -> None:
         if self._cache_size is None:
-            self._cache = {**items}
+            self._cache = OrderedDict(items)
         else:
-            merged_cache = {**self._cache, **items}
-            cache_array = tuple(merged_cache.items())
-            self._cache = dict(cache_array[: self._cache_size])
+            for key, item in items.items():
+                self._cache[key] = item
+                self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
         await self._event.cache_update(self._cache)
 
     def _parse_items(self, items: Mapping[str, bytes]) -> dict[str, T]:
-        parsed_items: Mapping[str, T] = {}
-        for key, item_bytes in items.items():
-            item = self._serializer.deserialize(item_bytes)
+        values = batch_deserialize(self._serializer, items.values())
+        parsed_items: dict[str, T] = {}
+        for key, item in zip(items.keys(), values, strict=True):
             if item is None:
                 raise ValueError(f"Failed to deserialize item with key: {key}")
             parsed_items[key] = item
         return parsed_items
 
-    def _serialize_items(self, items: Iterable[T]) -> Mapping[str, bytes]:
-        serialized_items: Mapping[str, bytes] = {}
-        for item in items:
-            key = self._key_function(item)
-            serialized_items[key] = self._serializer.serialize(item)
-        return serialized_items
+    def _serialize_items(self, items: Iterable[T]) -> dict[str, bytes]:
+        items = tuple(items)
+        if len(items) == 1:
+            item = items[0]
+            return {self._key_function(item): self._serializer.serialize(item)}
+        keys = [self._key_function(item) for item in items]
+        values = batch_serialize(self._serializer, items)
+        return dict(zip(keys, values, strict=True))
 
     def set_cache_size(self, size: int | None) -> None:
         self._cache_size = size
@@ -19,6 +19,7 @@ class Identifier(Model[str], Keyable):
         self.validate(namespace, *path)
         self.namespace: Final[str] = namespace
         self.path: Final[tuple[str, ...]] = path
+        self._key: Final[str] = f"{namespace}:{'/'.join(path)}"
 
     @classmethod
     def validate(cls, namespace: str, *path: str) -> None:
@@ -71,7 +72,7 @@ class Identifier(Model[str], Keyable):
         return cls.from_key(json)
 
     def key(self) -> str:
-        return self.format(self.namespace, *self.path)
+        return self._key
 
     def get_sanitized_path(self) -> Path:
         namespace = (
@@ -108,8 +109,7 @@ class Identifier(Model[str], Keyable):
             return NotImplemented
         return self.key() == other.key()
 
-    def __hash__(self) -> int:
-        return hash(self.key())
+    __hash__ = Keyable.__hash__
 
     def __repr__(self) -> str:
         return f"Identifier({self.key()})"
@@ -2,11 +2,32 @@ import abc
 
 
 class Keyable(abc.ABC):
+    # Cached on first hash; key() must not change once the object is hashed.
+    _hash: int | None = None
+
     @abc.abstractmethod
     def key(self) -> str: ...
 
     def __hash__(self) -> int:
-        return hash(self.key())
+        hash_value = self._hash
+        if hash_value is None:
+            hash_value = hash(self.key())
+            object.__setattr__(self, "_hash", hash_value)
+        return hash_value
+
+    def __getstate__(self) -> object:
+        # String hashes are salted per process, so never pickle the cached value.
+        state = super().__getstate__()
+        if isinstance(state, tuple):
+            instance_state, slot_state = state
+            if instance_state and "_hash" in instance_state:
+                instance_state = dict(instance_state)
+                del instance_state["_hash"]
+            return instance_state, slot_state
+        if state and "_hash" in state:
+            state = dict(state)
+            del state["_hash"]
+        return state
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.key()})"
@@ -12,6 +12,32 @@ class PacketData:
     type: str
     data: bytes
 
+    def to_frame(self) -> bytes:
+        type_bytes = self.type.encode("utf-8")
+        if len(self.data) > 0xFFFFFFFF:
+            raise ValueError("Byte array too large")
+        return b"".join(
+            (
+                len(type_bytes).to_bytes(4, "big"),
+                type_bytes,
+                len(self.data).to_bytes(4, "big"),
+                self.data,
+            )
+        )
+
+    @classmethod
+    def from_frame(cls, frame: bytes) -> PacketData:
+        view = memoryview(frame)
+        type_end = 4 + int.from_bytes(view[:4], "big")
+        data_start = type_end + 4
+        data_end = data_start + int.from_bytes(view[type_end:data_start], "big")
+        if data_end != len(view):
+            raise ValueError("Invalid packet frame length")
+        return cls(
+            type=str(view[4:type_end], "utf-8"),
+            data=view[data_start:data_end].tobytes(),
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class Packet[T]:
@@ -25,7 +51,7 @@ class PacketClass[T](Protocol):
     def deserialize(self, item: bytes) -> T: ...
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class PacketType[T]:
     id: Identifier
     serializer: Serializable[T, bytes]
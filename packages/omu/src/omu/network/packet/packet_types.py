@@ -94,7 +94,8 @@ class PACKET_TYPES:
         IDENTIFIER,
         "token",
     )
-    READY = PacketType[None].create_json(
+    READY = PacketType[None].create_serialized(
         IDENTIFIER,
         "ready",
+        Serializer.null(),
     )
@@ -1,5 +1,4 @@
 from omu.errors import InvalidPacket
-from omu.identifier import Identifier
 from omu.serializer import Serializable
 
 from .packet import Packet, PacketData, PacketType
@@ -7,29 +6,37 @@ from .packet import Packet, PacketData, PacketType
 
 class PacketMapper(Serializable[Packet, PacketData]):
     def __init__(self) -> None:
-        self._map: dict[Identifier, PacketType] = {}
+        self._map: dict[str, PacketType] = {}
+        self._last_serialized: tuple[Packet, PacketData] | None = None
 
     def register(self, *packet_types: PacketType) -> None:
         for packet_type in packet_types:
-            if self._map.get(packet_type.id):
+            key = packet_type.id.key()
+            if self._map.get(key):
                 raise ValueError(f"Packet id {packet_type.id} already registered")
-            self._map[packet_type.id] = packet_type
+            self._map[key] = packet_type
 
     def serialize(self, item: Packet) -> PacketData:
-        return PacketData(
+        last = self._last_serialized
+        if last is not None and last[0] is item:
+            return last[1]
+        packet_data = PacketData(
             type=item.type.id.key(),
             data=item.type.serializer.serialize(item.data),
         )
+        self._last_serialized = (item, packet_data)
+        return packet_data
 
     def deserialize(self, item: PacketData) -> Packet:
-        id = Identifier.from_key(item.type)
-        packet_type = self._map.get(id)
+        packet_type = self._map.get(item.type)
         if not packet_type:
-            raise InvalidPacket(id, f"Packet type {id} not registered")
+            raise InvalidPacket(item.type, f"Packet type {item.type} not registered")
         try:
             data = packet_type.serializer.deserialize(item.data)
         except Exception as e:
-            raise InvalidPacket(id, "Failed to deserialize packet data") from e
+            raise InvalidPacket(
+                packet_type.id, "Failed to deserialize packet data"
+            ) from e
         return Packet(
             type=packet_type,
             data=data,
@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+
 import aiohttp
 from aiohttp import web
 
 from omu.address import Address
-from omu.bytebuffer import ByteReader, ByteWriter
 from omu.client import Client
 from omu.serializer import Serializable
 
 from .connection import Connection
 from .packet import Packet, PacketData
 
+OFFLOAD_THRESHOLD = 32 * 1024
+LOCAL_HOSTS = frozenset({None, "127.0.0.1", "localhost", "::1"})
+CLOSE_MESSAGE_TYPES = frozenset(
+    {
+        web.WSMsgType.CLOSE,
+        web.WSMsgType.CLOSED,
+        web.WSMsgType.CLOSING,
+        web.WSMsgType.ERROR,
+    }
+)
+
 
 class WebsocketsConnection(Connection):
     def __init__(self, client: Client, address: Address):
@@ -30,7 +42,10 @@ class WebsocketsConnection(Connection):
     async def connect(self) -> None:
         if self._socket and not self._socket.closed:
             raise RuntimeError("Already connected")
-        self._socket = await self._session.ws_connect(self._ws_endpoint)
+        self._socket = await self._session.ws_connect(
+            self._ws_endpoint,
+            compress=0 if self._address.host in LOCAL_HOSTS else 15,
+        )
         self._connected = True
 
     async def send(
@@ -39,35 +54,30 @@ class WebsocketsConnection(Connection):
         if not self._socket or self._socket.closed or not self._connected:
             raise RuntimeError("Not connected")
         packet_data = packet_mapper.serialize(packet)
-        writer = ByteWriter()
-        writer.write_string(packet_data.type)
-        writer.write_byte_array(packet_data.data)
-        await self._socket.send_bytes(writer.finish())
+        await self._socket.send_bytes(packet_data.to_frame())
 
     async def receive(self, packet_mapper: Serializable[Packet, PacketData]) -> Packet:
         if not self._socket or self._socket.closed:
             raise RuntimeError("Not connected")
         msg = await self._socket.receive()
-        if msg.type in {
-            web.WSMsgType.CLOSE,
-            web.WSMsgType.CLOSED,
-            web.WSMsgType.CLOSING,
-            web.WSMsgType.ERROR,
-        }:
+        if msg.type in CLOSE_MESSAGE_TYPES:
             raise RuntimeError(f"Socket {msg.type.name.lower()}")
         if msg.data is None:
             raise RuntimeError("Received empty message")
         if msg.type == web.WSMsgType.TEXT:
             raise RuntimeError("Received text message")
         elif msg.type == web.WSMsgType.BINARY:
-            with ByteReader(msg.data) as reader:
-                event_type = reader.read_string()
-                event_data = reader.read_byte_array()
-            packet_data = PacketData(event_type, event_data)
-            return packet_mapper.deserialize(packet_data)
+            if len(msg.data) >= OFFLOAD_THRESHOLD:
+                return await asyncio.to_thread(self._decode, msg.data, packet_mapper)
+            return self._decode(msg.data, packet_mapper)
         else:
             raise RuntimeError(f"Unknown message type {msg.type}")
 
+    def _decode(
+        self, data: bytes, packet_mapper: Serializable[Packet, PacketData]
+    ) -> Packet:
+        return packet_mapper.deserialize(PacketData.from_frame(data))
+
     async def close(self) -> None:
         if not self._socket or self._socket.closed:
             return
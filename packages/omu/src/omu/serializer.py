@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import abc
 import json
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from typing import Protocol
 
 
@@ -36,6 +36,14 @@ class Serializer[T, D](Serializable[T, D]):
     def deserialize(self, item: D) -> T:
         return self._deserialize(item)
 
+    def batch_serialize(self, items: Iterable[T]) -> list[D]:
+        serialize = self._serialize
+        return [serialize(item) for item in items]
+
+    def batch_deserialize(self, items: Iterable[D]) -> list[T]:
+        deserialize = self._deserialize
+        return [deserialize(item) for item in items]
+
     @classmethod
     def of[_T, _D](cls, serializer: Serializable[_T, _D]) -> Serializer[_T, _D]:
         return Serializer(serializer.serialize, serializer.deserialize)
@@ -44,6 +52,10 @@ class Serializer[T, D](Serializable[T, D]):
     def noop(cls) -> Serializer[T, T]:
         return NoopSerializer()
 
+    @classmethod
+    def null(cls) -> Serializer[None, bytes]:
+        return NullSerializer()
+
     @classmethod
     def model[_T, _D](cls, model: type[JsonSerializable[_T, _D]]) -> Serializer[_T, _D]:
         return ModelSerializer(model)
@@ -69,10 +81,24 @@ class NoopSerializer[T](Serializer[T, T]):
     def __init__(self):
         super().__init__(lambda item: item, lambda item: item)
 
+    def batch_serialize(self, items: Iterable[T]) -> list[T]:
+        return list(items)
+
+    def batch_deserialize(self, items: Iterable[T]) -> list[T]:
+        return list(items)
+
     def __repr__(self) -> str:
         return "NoopSerializer()"
 
 
+class NullSerializer(Serializer[None, bytes]):
+    def __init__(self):
+        super().__init__(lambda _: b"null", lambda _: None)
+
+    def __repr__(self) -> str:
+        return "NullSerializer()"
+
+
 class ModelSerializer[M: JsonSerializable, D](Serializer[M, D]):
     def __init__(self, model: type[JsonSerializable[M, D]]):
         self._model = model
@@ -80,6 +106,13 @@ class ModelSerializer[M: JsonSerializable, D](Serializer[M, D]):
             lambda item: item.to_json(), lambda item: model.from_json(item)
         )
 
+    def batch_serialize(self, items: Iterable[M]) -> list[D]:
+        return [item.to_json() for item in items]
+
+    def batch_deserialize(self, items: Iterable[D]) -> list[M]:
+        from_json = self._model.from_json
+        return [from_json(item) for item in items]
+
     def __repr__(self) -> str:
         return f"ModelSerializer({self._model})"
 
@@ -101,6 +134,10 @@ class JsonSerializer[T](Serializer[T, bytes]):
         except json.JSONDecodeError as e:
             raise SerializeError(f"Failed to deserialize JSON: {decoded}") from e
 
+    def batch_serialize(self, items: Iterable[T]) -> list[bytes]:
+        encode = json.JSONEncoder().encode
+        return [encode(item).encode("utf-8") for item in items]
+
     def __repr__(self) -> str:
         return "JsonSerializer()"
 
@@ -146,5 +183,27 @@ class PipeSerializer[T, D, E](Serializer[T, E]):
             lambda item: a.deserialize(b.deserialize(item)),
         )
 
+    def batch_serialize(self, items: Iterable[T]) -> list[E]:
+        return batch_serialize(self._b, batch_serialize(self._a, items))
+
+    def batch_deserialize(self, items: Iterable[E]) -> list[T]:
+        return batch_deserialize(self._a, batch_deserialize(self._b, items))
+
     def __repr__(self) -> str:
         return f"PipeSerializer({self._a}, {self._b})"
+
+
+def batch_serialize[T, D](
+    serializer: Serializable[T, D], items: Iterable[T]
+) -> list[D]:
+    if isinstance(serializer, Serializer):
+        return serializer.batch_serialize(items)
+    return [serializer.serialize(item) for item in items]
+
+
+def batch_deserialize[T, D](
+    serializer: Serializable[T, D], items: Iterable[D]
+) -> list[T]:
+    if isinstance(serializer, Serializer):
+        return serializer.batch_deserialize(items)
+    return [serializer.deserialize(item) for item in items]
@@ -0,0 +1,43 @@
+from omu.bytebuffer import ByteReader, ByteWriter
+from omu.network.packet.packet import PacketData
+
+CASES = [
+    PacketData(type="", data=b""),
+    PacketData(type="com.example:test/packet", data=b'{"key": "value"}'),
+    PacketData(type="com.example:テスト", data=bytes(range(256)) * 300),
+]
+
+
+def test_frame_matches_byte_writer():
+    for packet in CASES:
+        writer = ByteWriter()
+        writer.write_string(packet.type)
+        writer.write_byte_array(packet.data)
+        assert packet.to_frame() == writer.finish()
+
+
+def test_frame_round_trip():
+    for packet in CASES:
+        frame = packet.to_frame()
+        assert PacketData.from_frame(frame) == packet
+        with ByteReader(frame) as reader:
+            assert reader.read_string() == packet.type
+            assert reader.read_byte_array() == packet.data
+
+
+def test_frame_rejects_trailing_bytes():
+    frame = CASES[1].to_frame() + b"\x00"
+    try:
+        PacketData.from_frame(frame)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError")
+
+
+def test_ready_packet_payload():
+    from omu.network.packet import PACKET_TYPES
+
+    serializer = PACKET_TYPES.READY.serializer
+    assert serializer.serialize(None) == b"null"
+    assert serializer.deserialize(b"null") is None
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from omu.extension.table import TableType
+from omu.extension.table.table_extension import TABLE_ITEM_ADD_PACKET, TableImpl
+from omu.identifier import Identifier
+from omu.serializer import Serializer
+
+TABLE_TYPE = TableType(
+    id=Identifier("com.example", "test", "table"),
+    serializer=Serializer.json(),
+    key_function=lambda item: item,
+)
+
+
+class FakeNetwork:
+    def __init__(self) -> None:
+        self.connected = True
+        self.tasks = []
+
+    def add_task(self, task) -> None:
+        self.tasks.append(task)
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.network = FakeNetwork()
+        self.loop = asyncio.get_running_loop()
+        self.sent = []
+        self.attempts = 0
+        self.fail = False
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def send(self, packet_type, data) -> None:
+        await self.gate.wait()
+        self.attempts += 1
+        if self.fail:
+            raise RuntimeError("Not connected")
+        self.sent.append((packet_type, dict(data.items)))
+
+
+@pytest.mark.asyncio
+async def test_flush_waits_for_inflight_send():
+    client = FakeClient()
+    table = TableImpl(client, TABLE_TYPE)  # type: ignore
+    client.gate.clear()
+    await table.add("x")
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    flush = asyncio.create_task(table.flush())
+    await asyncio.sleep(0)
+    assert not flush.done()
+    client.gate.set()
+    await flush
+    assert client.sent == [(TABLE_ITEM_ADD_PACKET, {"x": b'"x"'})]
+
+
+@pytest.mark.asyncio
+async def test_flush_keeps_items_on_send_failure():
+    client = FakeClient()
+    table = TableImpl(client, TABLE_TYPE)  # type: ignore
+    client.fail = True
+    await table.add("x")
+    with pytest.raises(RuntimeError):
+        await table.flush()
+    assert client.sent == []
+    client.fail = False
+    await table.add("y")
+    await table.flush()
+    assert client.sent == [(TABLE_ITEM_ADD_PACKET, {"x": b'"x"', "y": b'"y"'})]
+
+
+@pytest.mark.asyncio
+async def test_cache_bounds():
+    client = FakeClient()
+    table = TableImpl(client, TABLE_TYPE)  # type: ignore
+    await table.update_cache({"a": "a", "b": "b"})
+    await table.update_cache({"c": "c"})
+    assert list(table.cache) == ["c"]
+    table.set_cache_size(2)
+    await table.update_cache({"d": "d", "e": "e", "f": "f"})
+    assert list(table.cache) == ["e", "f"]
+
+
+@pytest.mark.asyncio
+async def test_get_respects_cache_size():
+    client = FakeClient()
+    table = TableImpl(client, TABLE_TYPE)  # type: ignore
+    table.set_cache_size(2)
+
+    class FakeEndpoints:
+        async def call(self, endpoint, packet):
+            return type("Response", (), {"items": dict.fromkeys(packet.keys, b'"v"')})
+
+    client.endpoints = FakeEndpoints()
+    await table.get_many("a", "b")
+    await table.get("c")
+    assert list(table.cache) == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_flush_waits_for_connection():
+    client = FakeClient()
+    client.network.connected = False
+    client.fail = True
+    table = TableImpl(client, TABLE_TYPE)  # type: ignore
+    await table.add("x")
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert client.attempts == 0
+    client.network.connected = True
+    client.fail = False
+    for task in client.network.tasks:
+        await task()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert client.sent == [(TABLE_ITEM_ADD_PACKET, {"x": b'"x"'})]
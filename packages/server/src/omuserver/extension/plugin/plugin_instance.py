@@ -36,10 +36,10 @@ class PluginInstance:
     plugin: Plugin
 
     @classmethod
-    def from_entry_point(
+    async def from_entry_point(
         cls, entry_point: importlib.metadata.EntryPoint
     ) -> PluginInstance:
-        plugin = entry_point.load()
+        plugin = await asyncio.to_thread(entry_point.load)
         if not isinstance(plugin, Plugin):
             raise ValueError(f"Invalid plugin: {plugin} is not a Plugin")
         return cls(plugin=plugin)
@@ -93,6 +93,7 @@ def run_plugin_isolated(
     client.network.set_token_provider(PluginTokenProvider(token))
     loop = asyncio.get_event_loop()
     loop.set_exception_handler(handle_exception)
+    loop.set_task_factory(asyncio.eager_task_factory)
     loop.run_until_complete(client.start())
     loop.run_forever()
     loop.close()
@@ -150,7 +150,7 @@ class PluginLoader:
                 await instance.plugin.on_stop_server(self._server)
 
     async def run_plugins(self):
-        self.load_plugins_from_entry_points()
+        await self.load_plugins_from_entry_points()
 
         for instance in self.instances.values():
             if instance.plugin.on_start_server is not None:
@@ -160,16 +160,23 @@ class PluginLoader:
             *(instance.start(self._server) for instance in self.instances.values())
         )
 
-    def load_plugins_from_entry_points(self):
+    async def load_plugins_from_entry_points(self):
         entry_points = importlib.metadata.entry_points(group=PLUGIN_GROUP)
+        to_load: dict[str, importlib.metadata.EntryPoint] = {}
         for entry_point in entry_points:
             if entry_point.dist is None:
                 raise ValueError(f"Invalid plugin: {entry_point} has no distribution")
             plugin_key = entry_point.dist.name
-            if plugin_key in self.instances:
+            if plugin_key in self.instances or plugin_key in to_load:
                 raise ValueError(f"Duplicate plugin: {entry_point}")
-            plugin = PluginInstance.from_entry_point(entry_point)
-            self.instances[plugin_key] = plugin
+            to_load[plugin_key] = entry_point
+        instances = await asyncio.gather(
+            *(
+                PluginInstance.from_entry_point(entry_point)
+                for entry_point in to_load.values()
+            )
+        )
+        self.instances.update(zip(to_load.keys(), instances, strict=True))
 
     async def load_updated_plugins(self):
         entry_points = importlib.metadata.entry_points(group=PLUGIN_GROUP)
@@ -179,7 +186,7 @@ class PluginLoader:
             plugin_key = entry_point.dist.name
             if plugin_key in self.instances:
                 continue
-            instance = PluginInstance.from_entry_point(entry_point)
+            instance = await PluginInstance.from_entry_point(entry_point)
             self.instances[plugin_key] = instance
             if instance.plugin.on_start_server is not None:
                 await instance.plugin.on_start_server(self._server)
@@ -1,5 +1,6 @@
 import asyncio
 
+from loguru import logger
 from omu import Identifier
 from omu.event_emitter import Unlisten
 from omu.extension.registry.packets import RegistryPermissions
@@ -12,6 +13,8 @@ from omu.serializer import Serializable
 from omuserver.server import Server
 from omuserver.session import Session
 
+NOTIFY_DELAY = 0.005
+
 
 class ServerRegistry:
     def __init__(
@@ -29,12 +32,20 @@ class ServerRegistry:
         self._changed = False
         self.value: bytes | None = None
         self.save_task: asyncio.Task | None = None
+        self.notify_task: asyncio.Task | None = None
+        self._notify_origin: Session | None = None
 
     async def load(self):
         if self._changed:
             raise Exception("Registry already loaded")
-        if self._path.exists():
-            self.value = self._path.read_bytes()
+        value = await asyncio.to_thread(self._read)
+        if value is not None:
+            self.value = value
+
+    def _read(self) -> bytes | None:
+        if not self._path.exists():
+            return None
+        return self._path.read_bytes()
 
     async def store(self, value: bytes | None) -> None:
         self.value = value
@@ -53,18 +64,51 @@ class ServerRegistry:
             await asyncio.sleep(1)
         self.save_task = None
 
-    async def notify(self, session: Session) -> None:
-        async with asyncio.TaskGroup() as tg:
-            for listener, _ in self._listeners.values():
-                if listener == session:
-                    continue
-                if listener.closed:
-                    raise Exception(f"Session {listener.app=} closed")
-                send = listener.send(
-                    REGISTRY_UPDATE_PACKET,
-                    RegistryPacket(id=self.id, value=self.value),
+    def schedule_notify(self, session: Session) -> None:
+        if self.notify_task is None:
+            self._notify_origin = session
+            self.notify_task = asyncio.create_task(self._notify_later())
+        elif self._notify_origin is not session:
+            self._notify_origin = None
+
+    async def _notify_later(self) -> None:
+        await asyncio.sleep(NOTIFY_DELAY)
+        origin = self._notify_origin
+        self.notify_task = None
+        self._notify_origin = None
+        try:
+            await self.notify(origin)
+        except Exception as e:
+            logger.opt(exception=e).error(f"Failed to notify registry {self.id}")
+
+    async def flush_notify(self) -> None:
+        task = self.notify_task
+        if task is None:
+            return
+        origin = self._notify_origin
+        self.notify_task = None
+        self._notify_origin = None
+        if task.get_loop().is_closed():
+            return
+        task.cancel()
+        await self.notify(origin)
+
+    async def notify(self, session: Session | None) -> None:
+        packet = RegistryPacket(id=self.id, value=self.value)
+        listeners = [
+            listener
+            for listener, _ in self._listeners.values()
+            if listener is not session and not listener.closed
+        ]
+        results = await asyncio.gather(
+            *(listener.send(REGISTRY_UPDATE_PACKET, packet) for listener in listeners),
+            return_exceptions=True,
+        )
+        for listener, result in zip(listeners, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.opt(exception=result).error(
+                    f"Failed to notify {listener.app.id} of registry {self.id}"
                 )
-                tg.create_task(send)
 
     async def attach_session(self, session: Session) -> None:
         if session.app.id in self._listeners:
@@ -81,6 +125,7 @@ class ServerRegistry:
             raise Exception("Session not attached")
         _, unlisten = self._listeners.pop(session.app.id)
         unlisten()
+        await self.flush_notify()
 
 
 class Registry[T]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 
 from omu.errors import PermissionDenied
@@ -37,6 +38,14 @@ REGISTRY_PERMISSION = PermissionType(
 )
 
 
+def read_scopes(permissions: RegistryPermissions) -> tuple[Identifier | None, ...]:
+    return permissions.all, permissions.read
+
+
+def write_scopes(permissions: RegistryPermissions) -> tuple[Identifier | None, ...]:
+    return permissions.all, permissions.write
+
+
 class RegistryExtension:
     def __init__(self, server: Server) -> None:
         self._server = server
@@ -59,12 +68,19 @@ class RegistryExtension:
         )
         server.endpoints.bind_endpoint(REGISTRY_GET_ENDPOINT, self.handle_get)
         server.event.start += self._on_start
+        server.event.stop += self._on_stop
 
     async def _on_start(self) -> None:
-        for registry in self._startup_registries:
-            await registry.load()
+        await asyncio.gather(
+            *(registry.load() for registry in self._startup_registries)
+        )
         self._startup_registries.clear()
 
+    async def _on_stop(self) -> None:
+        await asyncio.gather(
+            *(registry.flush_notify() for registry in self.registries.values())
+        )
+
     async def handle_register(
         self, session: Session, packet: RegistryRegisterPacket
     ) -> None:
@@ -79,7 +95,7 @@ class RegistryExtension:
         self.verify_permission(
             registry,
             session,
-            lambda permissions: [permissions.all, permissions.read],
+            read_scopes,
         )
         await registry.attach_session(session)
 
@@ -88,17 +104,17 @@ class RegistryExtension:
         self.verify_permission(
             registry,
             session,
-            lambda permissions: [permissions.all, permissions.write],
+            write_scopes,
         )
         await registry.store(packet.value)
-        await registry.notify(session)
+        registry.schedule_notify(session)
 
     async def handle_get(self, session: Session, id: Identifier) -> RegistryPacket:
         registry = await self.get(id)
         self.verify_permission(
             registry,
             session,
-            lambda permissions: [permissions.all, permissions.read],
+            read_scopes,
         )
         return RegistryPacket(id, registry.value)
 
@@ -117,7 +133,7 @@ class RegistryExtension:
         self,
         registry: ServerRegistry,
         session: Session,
-        get_scopes: Callable[[RegistryPermissions], list[Identifier | None]],
+        get_scopes: Callable[[RegistryPermissions], tuple[Identifier | None, ...]],
     ) -> None:
         if registry.id.is_namepath_equal(session.app.id, path_length=1):
             return
@@ -128,7 +144,9 @@ class RegistryExtension:
         # ):
         #     msg = f"App {session.app.id=} not allowed to access {registry.id=}"
         #     raise PermissionDenied(msg)
-        if not session.permission_handle.has_any(filter(None, require_permissions)):
+        if not session.permission_handle.has_any(
+            scope for scope in require_permissions if scope is not None
+        ):
             msg = f"App {session.app.id=} not allowed to access {registry.id=}"
             raise PermissionDenied(msg)
 
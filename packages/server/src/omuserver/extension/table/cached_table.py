@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from collections.abc import AsyncGenerator, Mapping
+from weakref import WeakKeyDictionary
 
+from loguru import logger
 from omu.extension.table import TableConfig, TablePermissions
 from omu.extension.table.table_extension import TABLE_PROXY_PACKET, TableProxyPacket
 from omu.identifier import Identifier
@@ -12,7 +15,10 @@ from omuserver.session import Session
 
 from .adapters.tableadapter import TableAdapter
 from .server_table import ServerTable, ServerTableEvents
-from .session_table_handler import SessionTableListener
+from .session_table_handler import SessionTableListener, TableItemsPacketCache
+
+STORE_DELAY = 5
+STORE_BATCH_SIZE = 1000
 
 
 class CachedTable(ServerTable):
@@ -24,15 +30,23 @@ class CachedTable(ServerTable):
         self._server = server
         self._id = id
         self._event = ServerTableEvents()
-        self._sessions: dict[Session, SessionTableListener] = {}
+        self._sessions: WeakKeyDictionary[Session, SessionTableListener] = (
+            WeakKeyDictionary()
+        )
+        self._packet_cache = TableItemsPacketCache(id)
         self._permissions: TablePermissions | None = None
         self._proxy_sessions: dict[str, Session] = {}
+        self._proxy_order: list[str] = []
+        self._proxy_index: dict[str, int] = {}
         self._changed = False
         self._proxy_id = 0
         self._save_task: asyncio.Task | None = None
+        self._dirty = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._pending_changes = 0
         self._adapter: TableAdapter | None = None
         self.config: TableConfig = {}
-        self._cache: dict[str, bytes] = {}
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
         self._cache_size: int | None = None
 
     def set_config(self, config: TableConfig) -> None:
@@ -59,8 +73,12 @@ class CachedTable(ServerTable):
             raise Exception("Table not set")
         if not self._changed:
             return
-        await self._adapter.store()
         self._changed = False
+        try:
+            await self._adapter.store()
+        except Exception:
+            self._changed = True
+            raise
 
     def attach_session(self, session: Session) -> None:
         if session in self._sessions:
@@ -69,27 +87,46 @@ class CachedTable(ServerTable):
             id=self._id,
             session=session,
             table=self,
+            packet_cache=self._packet_cache,
         )
         self._sessions[session] = handler
         session.event.disconnected += self.handle_disconnection
 
     def detach_session(self, session: Session) -> None:
-        if session in self._proxy_sessions:
-            del self._proxy_sessions[session.app.key()]
-        if session in self._sessions:
-            handler = self._sessions.pop(session)
+        session_key = session.app.key()
+        if self._proxy_sessions.get(session_key) is session:
+            del self._proxy_sessions[session_key]
+            self._proxy_order.remove(session_key)
+            self._proxy_index = {
+                key: index for index, key in enumerate(self._proxy_order)
+            }
+        handler = self._sessions.pop(session, None)
+        if handler is not None:
             handler.close()
 
     async def handle_disconnection(self, session: Session) -> None:
         self.detach_session(session)
 
+    def prune_sessions(self) -> None:
+        closed = [session for session in self._sessions if session.closed]
+        closed.extend(
+            session for session in self._proxy_sessions.values() if session.closed
+        )
+        for session in closed:
+            self.detach_session(session)
+
     def attach_proxy_session(self, session: Session) -> None:
-        self._proxy_sessions[session.app.key()] = session
+        session_key = session.app.key()
+        if session_key not in self._proxy_sessions:
+            self._proxy_index[session_key] = len(self._proxy_order)
+            self._proxy_order.append(session_key)
+        self._proxy_sessions[session_key] = session
 
     async def get(self, key: str) -> bytes | None:
         if self._adapter is None:
             raise Exception("Table not set")
         if key in self._cache:
+            self._cache.move_to_end(key)
             return self._cache[key]
         data = await self._adapter.get(key)
         if data is None:
@@ -98,35 +135,37 @@ class CachedTable(ServerTable):
         return data
 
     async def get_many(self, *keys: str) -> dict[str, bytes]:
-        key_list = list(keys)
         if self._adapter is None:
             raise Exception("Table not set")
         items: dict[str, bytes] = {}
-        for key in tuple(key_list):
+        missing: list[str] = []
+        for key in keys:
             if key in self._cache:
+                self._cache.move_to_end(key)
                 items[key] = self._cache[key]
-                key_list.remove(key)
-        if len(key_list) == 0:
+            else:
+                missing.append(key)
+        if len(missing) == 0:
             return items
-        data = await self._adapter.get_many(key_list)
-        for key, value in data.items():
-            items[key] = value
-        await self.update_cache(items)
+        data = await self._adapter.get_many(missing)
+        items.update(data)
+        await self.update_cache(data)
         return items
 
     async def add(self, items: Mapping[str, bytes]) -> None:
         if self._adapter is None:
             raise Exception("Table not set")
+        self.prune_sessions()
         if len(self._proxy_sessions) > 0:
             await self.send_proxy_event(items)
             return
         await self._adapter.set_all(items)
         await self._event.add(items)
         await self.update_cache(items)
-        self.mark_changed()
+        self.mark_changed(len(items))
 
     async def send_proxy_event(self, items: Mapping[str, bytes]) -> None:
-        session = tuple(self._proxy_sessions.values())[0]
+        session = self._proxy_sessions[self._proxy_order[0]]
         self._proxy_id += 1
         await session.send(
             TABLE_PROXY_PACKET,
@@ -143,20 +182,20 @@ class CachedTable(ServerTable):
         adapter = self._adapter
         if adapter is None:
             raise Exception("Table not set")
-        if session.app.key() not in self._proxy_sessions:
-            raise ValueError("Session not in proxy sessions")
         session_key = session.app.key()
-        index = tuple(self._proxy_sessions.keys()).index(session_key)
-        if index == len(self._proxy_sessions) - 1:
+        if session_key not in self._proxy_sessions:
+            raise ValueError("Session not in proxy sessions")
+        index = self._proxy_index[session_key]
+        if index == len(self._proxy_order) - 1:
             adapter = self._adapter
             if adapter is None:
                 raise Exception("Table not set")
             await adapter.set_all(items)
             await self._event.add(items)
             await self.update_cache(items)
-            self.mark_changed()
+            self.mark_changed(len(items))
             return 0
-        session = tuple(self._proxy_sessions.values())[index + 1]
+        session = self._proxy_sessions[self._proxy_order[index + 1]]
         await session.send(
             TABLE_PROXY_PACKET,
             TableProxyPacket(
@@ -170,21 +209,23 @@ class CachedTable(ServerTable):
     async def update(self, items: Mapping[str, bytes]) -> None:
         if self._adapter is None:
             raise Exception("Table not set")
+        self.prune_sessions()
         await self._adapter.set_all(items)
         await self._event.update(items)
         await self.update_cache(items)
-        self.mark_changed()
+        self.mark_changed(len(items))
 
     async def remove(self, keys: list[str]) -> None:
         if self._adapter is None:
             raise Exception("Table not set")
+        self.prune_sessions()
         removed = await self._adapter.get_many(keys)
         await self._adapter.remove_all(keys)
         for key in keys:
             if key in self._cache:
                 del self._cache[key]
         await self._event.remove(removed)
-        self.mark_changed()
+        self.mark_changed(len(keys))
 
     async def clear(self) -> None:
         if self._adapter is None:
@@ -231,12 +272,26 @@ class CachedTable(ServerTable):
         return len(self._cache)
 
     async def save_task(self) -> None:
-        while self._changed:
-            await self.store()
-            await asyncio.sleep(30)
-
-    def mark_changed(self) -> None:
+        while True:
+            await self._dirty.wait()
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), STORE_DELAY)
+            except TimeoutError:
+                pass
+            self._dirty.clear()
+            self._batch_full.clear()
+            self._pending_changes = 0
+            try:
+                await self.store()
+            except Exception as e:
+                logger.opt(exception=e).error(f"Failed to store table {self._id}")
+
+    def mark_changed(self, count: int = 1) -> None:
         self._changed = True
+        self._pending_changes += count
+        self._dirty.set()
+        if self._pending_changes >= STORE_BATCH_SIZE:
+            self._batch_full.set()
         if self._save_task is None:
             self._save_task = asyncio.create_task(self.save_task())
 
@@ -248,8 +303,9 @@ class CachedTable(ServerTable):
             return
         for key, item in items.items():
             self._cache[key] = item
-            if len(self._cache) > self._cache_size:
-                del self._cache[next(iter(self._cache))]
+            self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
         await self._event.cache_update(self._cache)
 
     @property
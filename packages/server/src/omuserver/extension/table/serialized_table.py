@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncGenerator, Mapping
 
 from omu.event_emitter import Unlisten
@@ -93,6 +94,9 @@ class SerializedTable[T: Keyable](Table[T]):
     async def clear(self) -> None:
         await self._table.clear()
 
+    async def flush(self) -> None:
+        pass
+
     async def fetch_items(
         self,
         before: int | None = None,
@@ -123,6 +127,7 @@ class SerializedTable[T: Keyable](Table[T]):
         for item in items.values():
             yield item
         while len(items) > 0:
+            await asyncio.sleep(0)
             cursor = next(iter(items.keys()))
             items = await self.fetch_items(
                 before=self._chunk_size if backward else None,
@@ -109,8 +109,12 @@ class ServerTable(abc.ABC):
 
 class ServerTableEvents:
     def __init__(self) -> None:
-        self.add = EventEmitter[Mapping[str, bytes]]()
-        self.update = EventEmitter[Mapping[str, bytes]]()
-        self.remove = EventEmitter[Mapping[str, bytes]]()
+        self.add = EventEmitter[Mapping[str, bytes]](catch_errors=True, concurrent=True)
+        self.update = EventEmitter[Mapping[str, bytes]](
+            catch_errors=True, concurrent=True
+        )
+        self.remove = EventEmitter[Mapping[str, bytes]](
+            catch_errors=True, concurrent=True
+        )
         self.clear = EventEmitter[[]]()
         self.cache_update = EventEmitter[Mapping[str, bytes]]()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from collections.abc import Mapping
 from typing import Any
 
@@ -13,16 +14,41 @@ from omu.extension.table.table_extension import (
 )
 from omu.helper import batch_call
 from omu.identifier import Identifier
+from omu.network.packet import Packet, PacketType
 
 from omuserver.extension.table.server_table import ServerTable
 from omuserver.session import Session
 
 
+class TableItemsPacketCache:
+    def __init__(self, id: Identifier) -> None:
+        self.id = id
+        self._last: tuple[PacketType, Mapping[str, Any], Packet] | None = None
+
+    def get(
+        self, packet_type: PacketType[TableItemsPacket], items: Mapping[str, Any]
+    ) -> Packet[TableItemsPacket]:
+        last = self._last
+        if last is not None and last[0] is packet_type and last[1] is items:
+            return last[2]
+        packet = Packet(packet_type, TableItemsPacket(id=self.id, items=items))
+        self._last = (packet_type, items, packet)
+        return packet
+
+
 class SessionTableListener:
-    def __init__(self, id: Identifier, session: Session, table: ServerTable) -> None:
+    def __init__(
+        self,
+        id: Identifier,
+        session: Session,
+        table: ServerTable,
+        packet_cache: TableItemsPacketCache,
+    ) -> None:
         self.id = id
-        self.session = session
+        self._session = weakref.ref(session)
         self.table = table
+        self.packet_cache = packet_cache
+        self.table_packet = TablePacket(id=id)
         self.unlisten = batch_call(
             table.event.add.listen(self.on_add),
             table.event.update.listen(self.on_update),
@@ -30,46 +56,49 @@ class SessionTableListener:
             table.event.clear.listen(self.on_clear),
         )
 
+    @property
+    def session(self) -> Session | None:
+        return self._session()
+
     def close(self) -> None:
         self.unlisten()
 
+    def _active_session(self) -> Session | None:
+        session = self._session()
+        if session is None or session.closed:
+            self.close()
+            return None
+        return session
+
     async def on_add(self, items: Mapping[str, Any]) -> None:
-        if self.session.closed:
+        session = self._active_session()
+        if session is None:
             return
-        await self.session.send(
-            TABLE_ITEM_ADD_PACKET,
-            TableItemsPacket(
-                id=self.id,
-                items=items,
-            ),
-        )
+        await session.send_packet(self.packet_cache.get(TABLE_ITEM_ADD_PACKET, items))
 
     async def on_update(self, items: Mapping[str, Any]) -> None:
-        if self.session.closed:
+        session = self._active_session()
+        if session is None:
             return
-        await self.session.send(
-            TABLE_ITEM_UPDATE_PACKET,
-            TableItemsPacket(
-                id=self.id,
-                items=items,
-            ),
+        await session.send_packet(
+            self.packet_cache.get(TABLE_ITEM_UPDATE_PACKET, items)
         )
 
     async def on_remove(self, items: Mapping[str, Any]) -> None:
-        if self.session.closed:
+        session = self._active_session()
+        if session is None:
             return
-        await self.session.send(
-            TABLE_ITEM_REMOVE_PACKET,
-            TableItemsPacket(
-                id=self.id,
-                items=items,
-            ),
+        await session.send_packet(
+            self.packet_cache.get(TABLE_ITEM_REMOVE_PACKET, items)
         )
 
     async def on_clear(self) -> None:
-        if self.session.closed:
+        session = self._active_session()
+        if session is None:
             return
-        await self.session.send(TABLE_ITEM_CLEAR_PACKET, TablePacket(id=self.id))
+        await session.send(TABLE_ITEM_CLEAR_PACKET, self.table_packet)
 
     def __repr__(self) -> str:
-        return f"<SessionTableHandler key={self.id} app={self.session.app}>"
+        session = self.session
+        app = session.app if session is not None else None
+        return f"<SessionTableHandler key={self.id} app={app}>"
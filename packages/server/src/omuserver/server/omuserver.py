@@ -1,6 +1,8 @@
 import asyncio
+import functools
 import json
 from collections.abc import Mapping
+from pathlib import Path
 
 import aiohttp
 from aiohttp import web
@@ -29,21 +31,38 @@ from omuserver.security.security import PermissionManager, ServerPermissionManag
 
 from .server import Server, ServerEvents
 
-client = aiohttp.ClientSession(
-    headers={
-        "User-Agent": json.dumps(
-            [
-                "omu",
-                {
-                    "name": "omuserver",
-                    "version": __version__,
-                },
-            ]
-        )
-    }
+PROXY_BUFFER_SIZE = 1 << 16
+
+
+@functools.lru_cache(maxsize=4096)
+def resolve_asset_path(root: Path, id: str) -> Path:
+    identifier = Identifier.from_key(id)
+    return safe_path_join(root, identifier.get_sanitized_path())
+
+
+USER_AGENT = json.dumps(
+    [
+        "omu",
+        {
+            "name": "omuserver",
+            "version": __version__,
+        },
+    ]
 )
 
 
+def create_client() -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        headers={"User-Agent": USER_AGENT},
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+        ),
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=30),
+    )
+
+
 class OmuServer(Server):
     def __init__(
         self,
@@ -63,6 +82,7 @@ class OmuServer(Server):
         self._network.add_http_route("/asset", self._handle_assets)
         self._security = ServerPermissionManager(self)
         self._running = False
+        self._client: aiohttp.ClientSession | None = None
         self._endpoints = EndpointExtension(self)
         self._permissions = PermissionExtension(self)
         self._tables = TableExtension(self)
@@ -80,8 +100,11 @@ class OmuServer(Server):
         no_cache = bool(request.query.get("no_cache"))
         if not url:
             return web.Response(status=400)
+        client = self._client
+        if client is None:
+            return web.Response(status=503)
         try:
-            async with client.get(url) as resp:
+            async with client.get(url, read_bufsize=PROXY_BUFFER_SIZE) as resp:
                 headers = {
                     "Cache-Control": "no-cache" if no_cache else "max-age=3600",
                     "Content-Type": resp.content_type,
@@ -96,6 +119,7 @@ class OmuServer(Server):
                 try:
                     async for chunk in resp.content.iter_any():
                         await response.write(chunk)
+                    await response.write_eof()
                 except ConnectionResetError:
                     pass
                 return response
@@ -109,11 +133,8 @@ class OmuServer(Server):
         id = request.query.get("id")
         if not id:
             return web.Response(status=400)
-        identifier = Identifier.from_key(id)
-        path = identifier.get_sanitized_path()
         try:
-            path = safe_path_join(self._directories.assets, path)
-
+            path = resolve_asset_path(self._directories.assets, id)
             if not path.exists():
                 return web.Response(status=404)
             return web.FileResponse(path)
@@ -126,9 +147,11 @@ class OmuServer(Server):
 
         try:
             loop.set_exception_handler(self.handle_exception)
+            loop.set_task_factory(asyncio.eager_task_factory)
             loop.create_task(self.start())
             loop.run_forever()
         finally:
+            loop.run_until_complete(self._close_client())
             loop.close()
             asyncio.run(self.shutdown())
 
@@ -151,11 +174,19 @@ class OmuServer(Server):
 
     async def start(self) -> None:
         self._running = True
+        self._client = create_client()
         await self._network.start()
 
     async def shutdown(self) -> None:
         self._running = False
         await self._event.stop()
+        if not self._loop.is_closed():
+            await self._close_client()
+
+    async def _close_client(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.close()
 
     @property
     def config(self) -> Config:
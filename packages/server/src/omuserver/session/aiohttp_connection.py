@@ -1,17 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+
 from aiohttp import web
 from loguru import logger
-from omu.bytebuffer import ByteReader, ByteWriter
 from omu.network.packet import Packet, PacketData
 from omu.network.packet_mapper import PacketMapper
 
 from .session import SessionConnection
 
+MAX_PENDING_FRAMES = 64
+OFFLOAD_THRESHOLD = 32 * 1024
+CLOSE_MESSAGE_TYPES = frozenset(
+    {
+        web.WSMsgType.CLOSE,
+        web.WSMsgType.CLOSING,
+        web.WSMsgType.CLOSED,
+    }
+)
+
 
 class WebsocketsConnection(SessionConnection):
     def __init__(self, socket: web.WebSocketResponse) -> None:
         self.socket = socket
+        self._send_queue: list[bytes] = []
+        self._send_task: asyncio.Task | None = None
+        self._drained = asyncio.Event()
+        self._drained.set()
 
     @property
     def closed(self) -> bool:
@@ -19,11 +34,7 @@ class WebsocketsConnection(SessionConnection):
 
     async def receive(self, packet_mapper: PacketMapper) -> Packet | None:
         msg = await self.socket.receive()
-        if msg.type in {
-            web.WSMsgType.CLOSE,
-            web.WSMsgType.CLOSING,
-            web.WSMsgType.CLOSED,
-        }:
+        if msg.type in CLOSE_MESSAGE_TYPES:
             return None
         if msg.type != web.WSMsgType.BINARY:
             raise RuntimeError(f"Unknown message type {msg.type}")
@@ -33,15 +44,18 @@ class WebsocketsConnection(SessionConnection):
         if msg.type == web.WSMsgType.TEXT:
             raise RuntimeError("Received text message")
         elif msg.type == web.WSMsgType.BINARY:
-            with ByteReader(msg.data) as reader:
-                event_type = reader.read_string()
-                event_data = reader.read_byte_array()
-            packet_data = PacketData(event_type, event_data)
-            return packet_mapper.deserialize(packet_data)
+            if len(msg.data) >= OFFLOAD_THRESHOLD:
+                return await asyncio.to_thread(self._decode, msg.data, packet_mapper)
+            return self._decode(msg.data, packet_mapper)
         else:
             raise RuntimeError(f"Unknown message type {msg.type}")
 
+    def _decode(self, data: bytes, packet_mapper: PacketMapper) -> Packet:
+        return packet_mapper.deserialize(PacketData.from_frame(data))
+
     async def close(self) -> None:
+        if self._send_task is not None:
+            await self._send_task
         try:
             await self.socket.close()
         except Exception as e:
@@ -52,7 +66,25 @@ class WebsocketsConnection(SessionConnection):
         if self.closed:
             raise ValueError("Socket is closed")
         packet_data = packet_mapper.serialize(packet)
-        writer = ByteWriter()
-        writer.write_string(packet_data.type)
-        writer.write_byte_array(packet_data.data)
-        await self.socket.send_bytes(writer.finish())
+        self._send_queue.append(packet_data.to_frame())
+        if self._send_task is None or self._send_task.done():
+            self._send_task = asyncio.create_task(self._flush())
+        if len(self._send_queue) >= MAX_PENDING_FRAMES:
+            self._drained.clear()
+            await self._drained.wait()
+
+    async def _flush(self) -> None:
+        # Each packet must stay its own websocket message, so frames are
+        # written back to back by one writer instead of joined together.
+        try:
+            while self._send_queue:
+                frames, self._send_queue = self._send_queue, []
+                for frame in frames:
+                    await self.socket.send_bytes(frame)
+                self._drained.set()
+        except Exception as e:
+            logger.opt(exception=e).error("Error sending to socket")
+            self._send_queue.clear()
+            await self.socket.close()
+        finally:
+            self._drained.set()
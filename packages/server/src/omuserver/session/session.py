@@ -25,6 +25,9 @@ from omuserver.server import Server
 if TYPE_CHECKING:
     from omuserver.security import PermissionHandle
 
+INBOUND_QUEUE_SIZE = 1024
+INBOUND_WORKERS = 8
+
 
 class SessionConnection(abc.ABC):
     @abc.abstractmethod
@@ -79,6 +82,12 @@ class Session:
         self.ready_tasks: list[SessionTask] = []
         self.ready = False
 
+    def __hash__(self) -> int:
+        return id(self)
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
     @classmethod
     async def from_connection(
         cls,
@@ -158,12 +167,32 @@ class Session:
         await self.event.disconnected.emit(self)
 
     async def listen(self) -> None:
-        while not self.connection.closed:
-            packet = await self.connection.receive(self.packet_mapper)
-            if packet is None:
-                await self.disconnect(DisconnectType.CLOSE)
-                return
-            asyncio.create_task(self.dispatch_packet(packet))
+        queue = asyncio.Queue[Packet](maxsize=INBOUND_QUEUE_SIZE)
+        workers = [
+            asyncio.create_task(self.dispatch_worker(queue))
+            for _ in range(INBOUND_WORKERS)
+        ]
+        try:
+            while not self.connection.closed:
+                packet = await self.connection.receive(self.packet_mapper)
+                if packet is None:
+                    await self.disconnect(DisconnectType.CLOSE)
+                    break
+                await queue.put(packet)
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def dispatch_worker(self, queue: asyncio.Queue[Packet]) -> None:
+        while True:
+            packet = await queue.get()
+            try:
+                await self.dispatch_packet(packet)
+            except Exception as e:
+                logger.opt(exception=e).error(f"Error handling packet {packet.type.id}")
+            finally:
+                queue.task_done()
 
     async def dispatch_packet(self, packet: Packet) -> None:
         try:
@@ -175,6 +204,9 @@ class Session:
     async def send[T](self, packet_type: PacketType[T], data: T) -> None:
         await self.connection.send(Packet(packet_type, data), self.packet_mapper)
 
+    async def send_packet(self, packet: Packet) -> None:
+        await self.connection.send(packet, self.packet_mapper)
+
     def add_ready_task(self, coro: Coro[[], None]):
         if self.ready:
             raise RuntimeError("Session is already ready")